@@ -13,6 +13,16 @@ from .core import (
     remove,
     match,
     delete,
+    keys,
+    count,
+    stats,
+    purge,
+    start_reaper,
+    stop_reaper,
+    set_compression,
+    convert,
+    watch,
+    MISSING,
 )
 
 __version__ = "10.0.0"
@@ -24,4 +34,14 @@ __all__ = [
     "remove",
     "match",
     "delete",
+    "keys",
+    "count",
+    "stats",
+    "purge",
+    "start_reaper",
+    "stop_reaper",
+    "set_compression",
+    "convert",
+    "watch",
+    "MISSING",
 ]
\ No newline at end of file
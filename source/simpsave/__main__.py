@@ -0,0 +1,63 @@
+"""
+@file __main__.py
+@author WaterRun
+@version 10.1
+@date 2025-11-10
+@description Command line entry point of SimpSave
+"""
+
+import argparse
+import sys
+
+from .core import convert
+
+
+def _print_progress(copied: int, total: int) -> None:
+    r"""
+    Report conversion progress on stderr
+    :param copied: Number of entries copied so far
+    :param total: Total number of entries to copy
+    """
+    print(f"\r{copied}/{total} entries", end='', file=sys.stderr, flush=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    r"""
+    Run the SimpSave command line interface
+    :param argv: Command line arguments (defaults to sys.argv[1:])
+    :return: Process exit code
+    """
+    parser = argparse.ArgumentParser(prog='python -m simpsave', description='SimpSave command line tools')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    convert_parser = subparsers.add_parser('convert', help='copy all entries from one storage file into another')
+    convert_parser.add_argument('src', help='source storage file (engine selected by extension)')
+    convert_parser.add_argument('dst', help='destination storage file (engine selected by extension)')
+    convert_parser.add_argument('--batch-size', type=int, default=1000, help='entries per write transaction (default: 1000)')
+    convert_parser.add_argument('--no-verify', action='store_true', help='skip checksum verification of the destination')
+    convert_parser.add_argument('--quiet', action='store_true', help='do not report progress')
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == 'convert':
+        try:
+            copied = convert(
+                args.src,
+                args.dst,
+                batch_size=args.batch_size,
+                verify=not args.no_verify,
+                progress=None if args.quiet else _print_progress,
+            )
+        except (FileNotFoundError, ValueError, RuntimeError) as e:
+            if not args.quiet:
+                print(file=sys.stderr)
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+        if not args.quiet:
+            print(file=sys.stderr)
+        print(f"Converted {copied} entries from {args.src} to {args.dst}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
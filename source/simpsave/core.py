@@ -10,8 +10,15 @@ import os
 import importlib.util
 import re
 import json
+import math
+import base64
+import time
+import threading
+import hashlib
+import contextlib
+import shutil
 import xml.etree.ElementTree as ET
-from typing import Any
+from typing import Any, Callable, Iterator
 
 
 def _get_extension_for_file(file: str | None) -> str:
@@ -190,6 +197,201 @@ def _json_compatible_to_python(value: Any) -> Any:
         return value
 
 
+def _is_expired(entry: dict[str, Any], now: float) -> bool:
+    r"""
+    Check whether a stored entry has passed its expiry time
+    :param entry: Stored entry with 'value', 'type' and optional 'expires_at'
+    :param now: Current timestamp (seconds since the epoch)
+    :return: True if the entry carries an expiry time that is not in the future
+    """
+    expires_at = entry.get('expires_at')
+    return expires_at is not None and float(expires_at) <= now
+
+
+def _purge_expired(data: dict[str, dict[str, Any]], now: float) -> int:
+    r"""
+    Drop expired entries from loaded data in place
+    :param data: Loaded data
+    :param now: Current timestamp (seconds since the epoch)
+    :return: Number of entries dropped
+    """
+    expired = [key for key, entry in data.items() if _is_expired(entry, now)]
+    for key in expired:
+        del data[key]
+    return len(expired)
+
+
+_COMPRESSION_CODECS = ('zlib', 'lzma', 'bz2')
+_compression: dict[str, tuple[str, int]] = {}
+
+
+def _get_codec(codec: str):
+    r"""
+    Get the standard library module implementing a compression codec
+    :param codec: Codec name ('zlib', 'lzma' or 'bz2')
+    :return: Module providing compress() and decompress()
+    :raise ValueError: If the codec is not supported
+    :raise RuntimeError: If the codec module is not available in this Python build
+    """
+    if codec not in _COMPRESSION_CODECS:
+        raise ValueError(f"Unsupported compression codec: {codec}. Valid codecs: {_COMPRESSION_CODECS}")
+    try:
+        return importlib.import_module(codec)
+    except ImportError:
+        raise RuntimeError(f"Compression codec '{codec}' requires the '{codec}' module (standard library)")
+
+
+def _compress_payload(payload: bytes, file: str) -> tuple[bytes, str | None]:
+    r"""
+    Compress a serialized value according to the compression settings of a file
+    :param payload: Serialized value
+    :param file: Parsed path of the storage file
+    :return: The (possibly compressed) payload and the codec used, or None if left uncompressed
+    """
+    settings = _compression.get(file)
+    if settings is None:
+        return payload, None
+    codec, threshold = settings
+    if len(payload) <= threshold:
+        return payload, None
+    compressed = _get_codec(codec).compress(payload)
+    # Incompressible data is stored as-is rather than grown
+    if len(compressed) >= len(payload):
+        return payload, None
+    return compressed, codec
+
+
+def _compress_json_value(json_value: Any, file: str) -> tuple[str, str] | None:
+    r"""
+    Compress a JSON-compatible value for a text-based engine
+    :param json_value: JSON-compatible value
+    :param file: Parsed path of the storage file
+    :return: Base64 text of the compressed value and the codec used, or None if left uncompressed
+    """
+    if file not in _compression:
+        return None
+    payload = json.dumps(json_value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    packed, codec = _compress_payload(payload, file)
+    if codec is None:
+        return None
+    encoded = base64.b64encode(packed).decode('ascii')
+    # Base64 adds a third; keep the plain JSON text unless the encoded form is still smaller
+    if len(encoded) >= len(payload):
+        return None
+    return encoded, codec
+
+
+def _decompress_json_value(value: str, codec: str) -> Any:
+    r"""
+    Restore a JSON-compatible value compressed by a text-based engine
+    :param value: Base64 text of the compressed value
+    :param codec: Codec the value was compressed with
+    :return: JSON-compatible value
+    """
+    payload = _get_codec(codec).decompress(base64.b64decode(value))
+    return json.loads(payload.decode('utf-8'))
+
+
+def set_compression(codec: str | None = 'zlib', *, threshold: int = 1024, file: str | None = None) -> None:
+    r"""
+    Configure transparent compression of large values written to a storage file
+    :param codec: Compression codec ('zlib', 'lzma' or 'bz2'); None disables compression
+    :param threshold: Only values whose serialized size exceeds this many bytes are compressed
+    :param file: Path to the storage file (engine auto-selected by extension)
+    :raise ValueError: If the codec is unsupported or threshold is negative
+    :raise RuntimeError: If the codec module is not available in this Python build
+    """
+    extension = _get_extension_for_file(file)
+    parsed_file = _path_parser(file, _get_engine_from_extension(extension))
+    
+    if codec is None:
+        _compression.pop(parsed_file, None)
+        return
+    
+    if isinstance(threshold, bool) or not isinstance(threshold, int) or threshold < 0:
+        raise ValueError("threshold must be a non-negative integer")
+    _get_codec(codec)
+    _compression[parsed_file] = (codec, threshold)
+
+
+def _make_entry(json_value: Any, value_type: str, engine: str, file: str) -> dict[str, Any]:
+    r"""
+    Build the stored entry of a value for a file-based engine
+    :param json_value: JSON-compatible value
+    :param value_type: Type name of the value
+    :param engine: Engine name
+    :param file: Parsed path of the storage file
+    :return: Entry with 'value', 'type' and optional 'codec'
+    """
+    compressed = _compress_json_value(json_value, file)
+    if compressed is not None:
+        return {'value': compressed[0], 'type': value_type, 'codec': compressed[1]}
+    if engine == "XML" or engine == "INI":
+        return {
+            'value': json.dumps(json_value, ensure_ascii=False, separators=(',', ':')), 
+            'type': value_type
+        }
+    return {'value': json_value, 'type': value_type}
+
+
+def _entry_to_json_value(entry: dict[str, Any], engine: str) -> Any:
+    r"""
+    Extract the JSON-compatible value from a stored entry
+    :param entry: Stored entry
+    :param engine: Engine name
+    :return: JSON-compatible value
+    """
+    if entry.get('codec') is not None:
+        return _decompress_json_value(entry['value'], entry['codec'])
+    if engine == "XML" or engine == "INI":
+        return json.loads(entry['value'])
+    return entry['value']
+
+
+@contextlib.contextmanager
+def _atomic_open(file: str, mode: str) -> Iterator[Any]:
+    r"""
+    Open a temporary file that atomically replaces the target when closed successfully
+    :param file: Path to the file to replace
+    :param mode: 'w' for UTF-8 text or 'wb' for binary
+    :return: Context manager yielding the open temporary file
+    """
+    # Readers and watchers never observe a truncated or half-written store.
+    # Replace the symlink target rather than the link itself
+    file = os.path.realpath(file)
+    temp_file = f'{file}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(temp_file, mode, encoding=None if 'b' in mode else 'utf-8') as f:
+            yield f
+        try:
+            st = os.stat(file)
+        except FileNotFoundError:
+            st = None
+        if st is not None:
+            # Keep the permissions and, where allowed, the owner of the replaced store
+            os.chmod(temp_file, st.st_mode & 0o7777)
+            if hasattr(os, 'chown'):
+                with contextlib.suppress(OSError):
+                    os.chown(temp_file, st.st_uid, st.st_gid)
+        if st is not None and st.st_nlink > 1:
+            # Replacing would detach this name from the other hard links; rewrite in place
+            shutil.copyfile(temp_file, file)
+            os.remove(temp_file)
+            return
+        try:
+            os.replace(temp_file, file)
+        except PermissionError:
+            if os.name != 'nt':
+                raise
+            # Windows refuses to replace a file another process holds open; rewrite it in place instead
+            shutil.copyfile(temp_file, file)
+            os.remove(temp_file)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_file)
+        raise
+
+
 def _xml_load(file: str) -> dict[str, dict[str, Any]]:
     r"""
     Load XML file
@@ -210,10 +412,65 @@ def _xml_load(file: str) -> dict[str, dict[str, Any]]:
         value_str = item.find('value').text or ''
         
         data[key] = {'value': value_str, 'type': value_type}
+        expires_elem = item.find('expires_at')
+        if expires_elem is not None and expires_elem.text:
+            data[key]['expires_at'] = float(expires_elem.text)
+        codec_elem = item.find('codec')
+        if codec_elem is not None and codec_elem.text:
+            data[key]['codec'] = codec_elem.text
     
     return data
 
 
+class _XmlKeyScanner:
+    r"""
+    XMLParser target that collects keys and expiry times while discarding value text
+    """
+    
+    def __init__(self) -> None:
+        self.keys: dict[str, float | None] = {}
+        self._key: str | None = None
+        self._expiry: list[str] | None = None
+    
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        if tag == 'item':
+            self._key = attrib.get('key')
+            self.keys[self._key] = None
+        elif tag == 'expires_at':
+            self._expiry = []
+    
+    def end(self, tag: str) -> None:
+        if tag == 'expires_at':
+            text = ''.join(self._expiry).strip()
+            if text:
+                self.keys[self._key] = float(text)
+            self._expiry = None
+    
+    def data(self, data: str) -> None:
+        if self._expiry is not None:
+            self._expiry.append(data)
+    
+    def close(self) -> dict[str, float | None]:
+        return self.keys
+
+
+def _xml_scan(file: str) -> dict[str, float | None]:
+    r"""
+    Scan XML file for keys without building value text
+    :param file: Path to the XML file
+    :return: Mapping of key to expiry timestamp (None if the key never expires)
+    :raise FileNotFoundError: If the file does not exist
+    """
+    if not os.path.isfile(file):
+        raise FileNotFoundError(f'The specified .xml file does not exist: {file}')
+    
+    parser = ET.XMLParser(target=_XmlKeyScanner())
+    with open(file, 'rb') as f:
+        while chunk := f.read(65536):
+            parser.feed(chunk)
+    return parser.close()
+
+
 def _xml_dump(data: dict[str, dict[str, Any]], file: str) -> None:
     r"""
     Dump data to XML file
@@ -231,10 +488,19 @@ def _xml_dump(data: dict[str, dict[str, Any]], file: str) -> None:
         
         value_elem = ET.SubElement(item, 'value')
         value_elem.text = val['value']
+        
+        if val.get('expires_at') is not None:
+            expires_elem = ET.SubElement(item, 'expires_at')
+            expires_elem.text = repr(float(val['expires_at']))
+        
+        if val.get('codec') is not None:
+            codec_elem = ET.SubElement(item, 'codec')
+            codec_elem.text = val['codec']
     
     tree = ET.ElementTree(root)
     ET.indent(tree, space='  ')
-    tree.write(file, encoding='utf-8', xml_declaration=True)
+    with _atomic_open(file, 'wb') as f:
+        tree.write(f, encoding='utf-8', xml_declaration=True)
 
 
 def _ini_load(file: str) -> dict[str, dict[str, Any]]:
@@ -262,6 +528,10 @@ def _ini_load(file: str) -> dict[str, dict[str, Any]]:
         value_str = config.get(section, 'value')
         
         data[section] = {'value': value_str, 'type': value_type}
+        if config.has_option(section, 'expires_at'):
+            data[section]['expires_at'] = config.getfloat(section, 'expires_at')
+        if config.has_option(section, 'codec'):
+            data[section]['codec'] = config.get(section, 'codec')
     
     return data
 
@@ -285,8 +555,12 @@ def _ini_dump(data: dict[str, dict[str, Any]], file: str) -> None:
         config.add_section(key)
         config.set(key, 'type', val['type'])
         config.set(key, 'value', val['value'])
+        if val.get('expires_at') is not None:
+            config.set(key, 'expires_at', repr(float(val['expires_at'])))
+        if val.get('codec') is not None:
+            config.set(key, 'codec', val['codec'])
     
-    with open(file, 'w', encoding='utf-8') as f:
+    with _atomic_open(file, 'w') as f:
         config.write(f)
 
 
@@ -311,7 +585,7 @@ def _json_dump(data: dict[str, dict[str, Any]], file: str) -> None:
     :param data: Data to dump
     :param file: Path to the JSON file
     """
-    with open(file, 'w', encoding='utf-8') as f:
+    with _atomic_open(file, 'w') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
@@ -336,6 +610,60 @@ def _yml_load(file: str) -> dict[str, dict[str, Any]]:
     return data if isinstance(data, dict) else {}
 
 
+def _yml_scan(file: str) -> dict[str, float | None]:
+    r"""
+    Scan YML file for keys from the parser event stream, without constructing values
+    :param file: Path to the YML file
+    :return: Mapping of key to expiry timestamp (None if the key never expires)
+    :raise FileNotFoundError: If the file does not exist
+    :raise RuntimeError: If yaml module is not available
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise RuntimeError("YML engine requires the 'pyyaml' package. Install with: pip install simpsave[yml]")
+    
+    if not os.path.isfile(file):
+        raise FileNotFoundError(f'The specified .yml file does not exist: {file}')
+    
+    keys = {}
+    depth = 0
+    key = field = None
+    top_is_key = field_is_key = True
+    
+    def node_done(level: int, scalar: str | None) -> None:
+        nonlocal key, field, top_is_key, field_is_key
+        if level == 1:
+            if top_is_key:
+                key = scalar
+                keys[key] = None
+            top_is_key = not top_is_key
+        elif level == 2:
+            if field_is_key:
+                field = scalar
+            elif field == 'expires_at' and scalar not in (None, '', 'null', '~'):
+                # YAML spells floats differently from Python (e.g. '.inf')
+                keys[key] = float(constructor.construct_yaml_float(yaml.ScalarNode('tag:yaml.org,2002:float', scalar)))
+            field_is_key = not field_is_key
+    
+    constructor = yaml.constructor.SafeConstructor()
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(file, 'r', encoding='utf-8') as f:
+        for event in yaml.parse(f, Loader=loader):
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                depth += 1
+                if depth == 2:
+                    field_is_key = True
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+                node_done(depth, None)
+            elif isinstance(event, yaml.ScalarEvent):
+                node_done(depth, event.value)
+            elif isinstance(event, yaml.AliasEvent):
+                node_done(depth, None)
+    return keys
+
+
 def _yml_dump(data: dict[str, dict[str, Any]], file: str) -> None:
     r"""
     Dump data to YML file
@@ -348,7 +676,7 @@ def _yml_dump(data: dict[str, dict[str, Any]], file: str) -> None:
     except ImportError:
         raise RuntimeError("YML engine requires the 'pyyaml' package. Install with: pip install simpsave[yml]")
     
-    with open(file, 'w', encoding='utf-8') as f:
+    with _atomic_open(file, 'w') as f:
         yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
 
 
@@ -388,7 +716,7 @@ def _toml_dump(data: dict[str, dict[str, Any]], file: str) -> None:
     except ImportError:
         raise RuntimeError("TOML write engine requires the 'tomli-w' package. Install with: pip install tomli-w")
     
-    with open(file, 'wb') as f:
+    with _atomic_open(file, 'wb') as f:
         tomli_w.dump(data, f)
 
 
@@ -409,16 +737,66 @@ def _sqlite_connect(file: str):
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS simpsave (
             key TEXT PRIMARY KEY,
-            value TEXT
+            value BLOB,
+            expires_at REAL,
+            codec TEXT
         )
     ''')
+    # Databases created by earlier versions lack the metadata columns
+    cursor.execute('PRAGMA table_info(simpsave)')
+    columns = {row[1] for row in cursor.fetchall()}
+    for column, column_type in (('expires_at', 'REAL'), ('codec', 'TEXT')):
+        if column not in columns:
+            cursor.execute(f'ALTER TABLE simpsave ADD COLUMN {column} {column_type}')
+    cursor.execute('CREATE INDEX IF NOT EXISTS simpsave_expires_at ON simpsave (expires_at)')
     conn.commit()
     return conn, cursor
 
 
+def _sqlite_decode(value_blob: bytes | str, codec: str | None) -> dict[str, Any]:
+    r"""
+    Decode a stored SQLite value into its 'value'/'type' entry
+    :param value_blob: Stored value (BLOB, or JSON TEXT written by earlier versions)
+    :param codec: Codec the value was compressed with, or None
+    :return: Decoded entry
+    """
+    if codec is not None:
+        value_blob = _get_codec(codec).decompress(value_blob)
+    if isinstance(value_blob, bytes):
+        value_blob = value_blob.decode('utf-8')
+    return json.loads(value_blob)
+
+
+def _sqlite_iter(file: str, now: float | None) -> Iterator[tuple[str, dict[str, Any]]]:
+    r"""
+    Stream unexpired entries from SQLite database without loading them all
+    :param file: Path to the SQLite database file
+    :param now: Timestamp entries must not have expired at, or None to include expired entries
+    :return: Iterator of (key, entry) pairs
+    :raise FileNotFoundError: If the file does not exist
+    """
+    if not os.path.isfile(file):
+        raise FileNotFoundError(f'The specified .db file does not exist: {file}')
+    
+    conn, cursor = _sqlite_connect(file)
+    try:
+        cursor.execute(
+            'SELECT key, value, expires_at, codec FROM simpsave '
+            'WHERE ? IS NULL OR expires_at IS NULL OR expires_at > ?',
+            (now, now)
+        )
+        for key, value_blob, expires_at, codec in cursor:
+            val = _sqlite_decode(value_blob, codec)
+            if expires_at is not None:
+                val['expires_at'] = expires_at
+            yield key, val
+    finally:
+        conn.close()
+
+
 def _sqlite_load(file: str) -> dict[str, dict[str, Any]]:
     r"""
-    Load data from SQLite database
+    Load unexpired data from SQLite database
     :param file: Path to the SQLite database file
     :return: Loaded dict object
     :raise FileNotFoundError: If the file does not exist
@@ -426,31 +804,103 @@ def _sqlite_load(file: str) -> dict[str, dict[str, Any]]:
     if not os.path.isfile(file):
         raise FileNotFoundError(f'The specified .db file does not exist: {file}')
     
+    return dict(_sqlite_iter(file, time.time()))
+
+
+def _sqlite_read(key: str, file: str) -> dict[str, Any] | None:
+    r"""
+    Read a single unexpired entry from SQLite database
+    :param key: Key to read
+    :param file: Path to the SQLite database file
+    :return: Stored entry, or None if the key does not exist or has expired
+    :raise FileNotFoundError: If the file does not exist
+    """
+    if not os.path.isfile(file):
+        raise FileNotFoundError(f'The specified .db file does not exist: {file}')
+    
     conn, cursor = _sqlite_connect(file)
-    cursor.execute('SELECT key, value FROM simpsave')
-    rows = cursor.fetchall()
+    cursor.execute(
+        'SELECT value, expires_at, codec FROM simpsave WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)',
+        (key, time.time())
+    )
+    row = cursor.fetchone()
     conn.close()
     
-    data = {}
-    for key, value_blob in rows:
-        val = json.loads(value_blob)
-        data[key] = val
-    return data
+    if row is None:
+        return None
+    val = _sqlite_decode(row[0], row[2])
+    if row[1] is not None:
+        val['expires_at'] = row[1]
+    return val
+
+
+def _sqlite_keys(file: str) -> list[str]:
+    r"""
+    List unexpired keys in SQLite database
+    :param file: Path to the SQLite database file
+    :return: List of keys
+    :raise FileNotFoundError: If the file does not exist
+    """
+    if not os.path.isfile(file):
+        raise FileNotFoundError(f'The specified .db file does not exist: {file}')
+    
+    conn, cursor = _sqlite_connect(file)
+    cursor.execute('SELECT key FROM simpsave WHERE expires_at IS NULL OR expires_at > ?', (time.time(),))
+    keys = [row[0] for row in cursor]
+    conn.close()
+    return keys
+
+
+def _sqlite_has(key: str, file: str) -> bool:
+    r"""
+    Check whether an unexpired key exists in SQLite database
+    :param key: Key to check
+    :param file: Path to the SQLite database file
+    :return: True if the key exists and has not expired
+    """
+    conn, cursor = _sqlite_connect(file)
+    cursor.execute(
+        'SELECT 1 FROM simpsave WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)',
+        (key, time.time())
+    )
+    found = cursor.fetchone() is not None
+    conn.close()
+    return found
+
+
+# Shared encoder; json.dumps() with keyword arguments builds a new one per call
+_sqlite_encoder = json.JSONEncoder(ensure_ascii=False)
+
+
+def _sqlite_encode(json_value: Any, value_type: str, file: str) -> tuple[bytes, str | None]:
+    r"""
+    Encode a value into the stored SQLite BLOB
+    :param json_value: JSON-compatible value
+    :param value_type: Type name of the value
+    :param file: Path to the SQLite database file
+    :return: Stored BLOB and the codec it was compressed with, or None
+    """
+    payload = _sqlite_encoder.encode({'value': json_value, 'type': value_type}).encode('utf-8')
+    return _compress_payload(payload, file)
 
 
-def _sqlite_write(key: str, value: Any, value_type: str, file: str) -> None:
+def _sqlite_write(key: str, value: Any, value_type: str, file: str, expires_at: float | None = None) -> None:
     r"""
     Write a key-value pair to SQLite database
     :param key: Key to write
     :param value: Value to write
     :param value_type: Type name of the value
     :param file: Path to the SQLite database file
+    :param expires_at: Expiry timestamp, or None for a key that never expires
     """
     json_value = _python_to_json_compatible(value)
+    value_blob, codec = _sqlite_encode(json_value, value_type, file)
     
     conn, cursor = _sqlite_connect(file)
-    value_blob = json.dumps({'value': json_value, 'type': value_type}, ensure_ascii=False)
-    cursor.execute('INSERT OR REPLACE INTO simpsave (key, value) VALUES (?, ?)', (key, value_blob))
+    cursor.execute(
+        'INSERT OR REPLACE INTO simpsave (key, value, expires_at, codec) VALUES (?, ?, ?, ?)',
+        (key, value_blob, expires_at, codec)
+    )
     conn.commit()
     conn.close()
 
@@ -470,11 +920,276 @@ def _sqlite_remove(key: str, file: str) -> bool:
     return rows_affected > 0
 
 
-def write(key: str, value: Any, *, file: str | None = None) -> bool:
+def _sqlite_purge(file: str, batch_size: int) -> int:
+    r"""
+    Delete expired keys from SQLite database in batches
+    :param file: Path to the SQLite database file
+    :param batch_size: Maximum number of rows deleted per transaction
+    :return: Number of keys deleted
+    """
+    now = time.time()
+    conn, cursor = _sqlite_connect(file)
+    removed = 0
+    try:
+        while True:
+            # Range scan on the expires_at index; small batches keep the write lock short
+            cursor.execute(
+                'DELETE FROM simpsave WHERE rowid IN '
+                '(SELECT rowid FROM simpsave WHERE expires_at <= ? LIMIT ?)',
+                (now, batch_size)
+            )
+            conn.commit()
+            removed += cursor.rowcount
+            if cursor.rowcount < batch_size:
+                break
+    finally:
+        conn.close()
+    return removed
+
+
+def _file_signature(file: str) -> tuple[int, int, int] | None:
+    r"""
+    Cheap fingerprint of a file used to detect rewrites
+    :param file: Path to the file
+    :return: (inode, mtime in ns, size), or None if the file does not exist
+    """
+    try:
+        st = os.stat(file)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _load_file(file: str, engine: str) -> dict[str, dict[str, Any]]:
+    r"""
+    Load a file-based store, treating a missing or empty file as empty
+    :param file: Parsed path of the storage file
+    :param engine: Engine name
+    :return: Loaded dict object
+    """
+    if not os.path.isfile(file) or os.path.getsize(file) == 0:
+        return {}
+    load_funcs = {"XML": _xml_load, "INI": _ini_load, "JSON": _json_load, "YML": _yml_load, "TOML": _toml_load}
+    return load_funcs[engine](file)
+
+
+_STORE_STRIPES = 16
+_UNLOADED = ('unloaded',)
+
+
+class _FlushBatch:
+    r"""
+    Group of mutations persisted together by a single dump
+    """
+    
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+
+
+class _SharedStore:
+    r"""
+    In-process image of a file-based store shared by all threads.
+    Readers use the image without locking; mutations take a per-key stripe lock
+    and are persisted in batches by the writer thread.
+    """
+    
+    def __init__(self, file: str, engine: str) -> None:
+        self.file = file
+        self.engine = engine
+        self.data: dict[str, dict[str, Any]] = {}
+        self.signature: tuple | None = _UNLOADED
+        self.pending: dict[str, dict[str, Any] | None] = {}
+        self.batch = _FlushBatch()
+        self.queued = False
+        self.stripes = [threading.Lock() for _ in range(_STORE_STRIPES)]
+        self.flush_lock = threading.Lock()
+    
+    @contextlib.contextmanager
+    def _all_stripes(self) -> Iterator[None]:
+        with contextlib.ExitStack() as stack:
+            for stripe in self.stripes:
+                stack.enter_context(stripe)
+            yield
+    
+    def refresh(self, strict: bool = True) -> None:
+        r"""
+        Reload the image if the file was changed outside this process
+        :param strict: Whether load errors propagate; otherwise the image becomes empty
+        """
+        if _file_signature(self.file) == self.signature:
+            return
+        with self.flush_lock, self._all_stripes():
+            # Unflushed mutations are rebased by the writer instead
+            if self.pending:
+                return
+            signature = _file_signature(self.file)
+            if signature == self.signature:
+                return
+            try:
+                data = _load_file(self.file, self.engine)
+            except Exception:
+                if strict:
+                    raise
+                data = {}
+            self.data = data
+            self.signature = signature
+    
+    def put(self, key: str, entry: dict[str, Any]) -> _FlushBatch:
+        r"""
+        Set an entry in the image and schedule it for persistence
+        :param key: Key to set
+        :param entry: Stored entry
+        :return: Batch the mutation belongs to
+        """
+        with self.stripes[hash(key) % _STORE_STRIPES]:
+            self.data[key] = entry
+            self.pending[key] = entry
+            return self.batch
+    
+    def pop(self, key: str) -> tuple[dict[str, Any] | None, _FlushBatch | None]:
+        r"""
+        Remove an entry from the image and schedule the removal for persistence
+        :param key: Key to remove
+        :return: Removed entry and its batch, or (None, None) if the key does not exist
+        """
+        with self.stripes[hash(key) % _STORE_STRIPES]:
+            entry = self.data.pop(key, None)
+            if entry is None:
+                return None, None
+            self.pending[key] = None
+            return entry, self.batch
+    
+    def pop_expired(self, now: float) -> tuple[int, _FlushBatch | None]:
+        r"""
+        Remove all expired entries from the image and schedule the removal for persistence
+        :param now: Current timestamp (seconds since the epoch)
+        :return: Number of entries removed and their batch (None if nothing expired)
+        """
+        with self._all_stripes():
+            expired = [key for key, entry in self.data.items() if _is_expired(entry, now)]
+            for key in expired:
+                del self.data[key]
+                self.pending[key] = None
+            return len(expired), self.batch if expired else None
+    
+    def commit(self, batch: _FlushBatch) -> None:
+        r"""
+        Wait until a batch has been written to disk
+        :param batch: Batch returned by a mutation
+        :raise Exception: Whatever the dump of the batch raised
+        """
+        if not self.queued:
+            self.queued = True
+            _writer_queue_put(self)
+        batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+    
+    def flush(self) -> None:
+        r"""
+        Persist all pending mutations with a single dump
+        """
+        dump_funcs = {"XML": _xml_dump, "INI": _ini_dump, "JSON": _json_dump, "YML": _yml_dump, "TOML": _toml_dump}
+        
+        with self.flush_lock:
+            batch = None
+            try:
+                with self._all_stripes():
+                    pending, self.pending = self.pending, {}
+                    batch, self.batch = self.batch, _FlushBatch()
+                    if not pending:
+                        return
+                    if _file_signature(self.file) != self.signature:
+                        # Another process rewrote the store; rebase our mutations on its content
+                        try:
+                            data = _load_file(self.file, self.engine)
+                        except Exception:
+                            data = {}
+                        for key, entry in pending.items():
+                            if entry is None:
+                                data.pop(key, None)
+                            else:
+                                data[key] = entry
+                        self.data = data
+                    # Expired keys leave the image together with the file
+                    _purge_expired(self.data, time.time())
+                    snapshot = dict(self.data)
+                
+                dump_funcs[self.engine](snapshot, self.file)
+                self.signature = _file_signature(self.file)
+            except BaseException as e:
+                if batch is not None:
+                    batch.error = e
+                # The image may hold unsaved changes; reload it on next access
+                self.signature = _UNLOADED
+            finally:
+                # Waiters in commit() must wake up whatever happened
+                if batch is not None:
+                    batch.done.set()
+
+
+_stores: dict[str, _SharedStore] = {}
+_stores_lock = threading.Lock()
+_writer_queue: list[_SharedStore] = []
+_writer_wakeup = threading.Condition()
+_writer_thread: threading.Thread | None = None
+
+
+def _writer_loop() -> None:
+    r"""
+    Single writer thread that flushes the queued stores
+    """
+    while True:
+        with _writer_wakeup:
+            while not _writer_queue:
+                _writer_wakeup.wait()
+            store = _writer_queue.pop(0)
+            # Mutations from now on need another flush
+            store.queued = False
+        try:
+            store.flush()
+        except Exception:
+            # One broken store must not stop the writer for every other store
+            continue
+
+
+def _writer_queue_put(store: _SharedStore) -> None:
+    r"""
+    Queue a store for flushing, starting the writer thread on first use
+    :param store: Store with pending mutations
+    """
+    global _writer_thread
+    with _writer_wakeup:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, name='simpsave-writer', daemon=True)
+            _writer_thread.start()
+        _writer_queue.append(store)
+        _writer_wakeup.notify()
+
+
+def _get_store(file: str, engine: str) -> _SharedStore:
+    r"""
+    Get the shared in-process image of a file-based store
+    :param file: Parsed path of the storage file
+    :param engine: Engine name
+    :return: Shared store
+    """
+    store = _stores.get(file)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(file)
+            if store is None:
+                store = _stores[file] = _SharedStore(file, engine)
+    return store
+
+
+def write(key: str, value: Any, *, ttl: float | None = None, file: str | None = None) -> bool:
     r"""
     Write data to the storage backend
     :param key: Key to write to
     :param value: Value to write
+    :param ttl: Time to live in seconds (finite and positive); the key never expires if None
     :param file: Path to the storage file (engine auto-selected by extension)
     :return: Whether the write was successful
     """
@@ -483,7 +1198,12 @@ def write(key: str, value: Any, *, file: str | None = None) -> bool:
     except TypeError:
         return False
     
+    if ttl is not None and (isinstance(ttl, bool) or not isinstance(ttl, (int, float))
+                            or not math.isfinite(ttl) or ttl <= 0):
+        return False
+    
     value_type = type(value).__name__
+    expires_at = time.time() + ttl if ttl is not None else None
     
     try:
         # Determine engine from file extension
@@ -494,38 +1214,19 @@ def write(key: str, value: Any, *, file: str | None = None) -> bool:
         parsed_file = _path_parser(file, engine)
         
         if engine == "SQLITE":
-            _sqlite_write(key, value, value_type, parsed_file)
+            _sqlite_write(key, value, value_type, parsed_file, expires_at)
             return True
         
-        # Create file if it doesn't exist
-        if not os.path.exists(parsed_file):
-            with open(parsed_file, 'w', encoding='utf-8') as new_file:
-                if engine == "XML":
-                    new_file.write('<?xml version="1.0" encoding="utf-8"?>\n<simpsave></simpsave>')
-                else:
-                    new_file.write("")
-        
-        load_funcs = {"XML": _xml_load, "INI": _ini_load, "JSON": _json_load, "YML": _yml_load, "TOML": _toml_load}
-        dump_funcs = {"XML": _xml_dump, "INI": _ini_dump, "JSON": _json_dump, "YML": _yml_dump, "TOML": _toml_dump}
-        
-        data = {}
-        if os.path.exists(parsed_file) and os.path.getsize(parsed_file) > 0:
-            try:
-                data = load_funcs[engine](parsed_file)
-            except Exception:
-                data = {}
+        store = _get_store(parsed_file, engine)
+        store.refresh(strict=False)
         
         json_value = _python_to_json_compatible(value)
+        entry = _make_entry(json_value, value_type, engine, parsed_file)
         
-        if engine == "XML" or engine == "INI":
-            data[key] = {
-                'value': json.dumps(json_value, ensure_ascii=False, separators=(',', ':')), 
-                'type': value_type
-            }
-        else:
-            data[key] = {'value': json_value, 'type': value_type}
+        if expires_at is not None:
+            entry['expires_at'] = expires_at
         
-        dump_funcs[engine](data, parsed_file)
+        store.commit(store.put(key, entry))
         return True
     except Exception:
         return False
@@ -538,7 +1239,7 @@ def read(key: str, *, file: str | None = None) -> Any:
     :param file: Path to the storage file (engine auto-selected by extension)
     :return: The value after conversion
     :raise FileNotFoundError: If the specified file does not exist
-    :raise KeyError: If the key does not exist
+    :raise KeyError: If the key does not exist or has expired
     :raise ValueError: If unable to convert the value
     """
     # Determine engine from file extension
@@ -549,35 +1250,54 @@ def read(key: str, *, file: str | None = None) -> Any:
     parsed_file = _path_parser(file, engine)
     
     if engine == "SQLITE":
-        data = _sqlite_load(parsed_file)
-        if key not in data:
+        val = _sqlite_read(key, parsed_file)
+        if val is None:
             raise KeyError(f'Key {key} does not exist in file {parsed_file}')
-        val = data[key]
         python_value = _json_compatible_to_python(val['value'])
         return python_value
     else:
-        load_funcs = {"XML": _xml_load, "INI": _ini_load, "JSON": _json_load, "YML": _yml_load, "TOML": _toml_load}
-        data = load_funcs[engine](parsed_file)
+        # Only writes create a shared image; do not keep one for a file that does not exist
+        if parsed_file not in _stores and not os.path.isfile(parsed_file):
+            raise FileNotFoundError(f'The specified .{extension} file does not exist: {parsed_file}')
+        store = _get_store(parsed_file, engine)
+        store.refresh()
         
-        if key not in data:
+        val = store.data.get(key)
+        if val is None or _is_expired(val, time.time()):
+            if not os.path.isfile(parsed_file):
+                raise FileNotFoundError(f'The specified .{extension} file does not exist: {parsed_file}')
             raise KeyError(f'Key {key} does not exist in file {parsed_file}')
-        val = data[key]
-    
-    value, type_str = val['value'], val['type']
-    
-    if engine == "XML" or engine == "INI":
-        try:
-            json_value = json.loads(value)
-            python_value = _json_compatible_to_python(json_value)
-            return python_value
-        except Exception as e:
-            raise ValueError(f'Unable to convert value to type {type_str}: {e}')
     
     try:
-        python_value = _json_compatible_to_python(value)
+        json_value = _entry_to_json_value(val, engine)
+        python_value = _json_compatible_to_python(json_value)
         return python_value
     except Exception as e:
-        raise ValueError(f'Unable to convert value to type {type_str}: {e}')
+        raise ValueError(f'Unable to convert value to type {val["type"]}: {e}')
+
+
+def _scan_keys(file: str, engine: str) -> dict[str, float | None]:
+    r"""
+    Collect the keys of a file-based store without converting values
+    :param file: Parsed path of the storage file
+    :param engine: Engine name
+    :return: Mapping of key to expiry timestamp (None if the key never expires)
+    :raise FileNotFoundError: If the file does not exist
+    """
+    # A process that already holds the image only needs to revalidate it
+    store = _stores.get(file)
+    if store is not None:
+        store.refresh()
+        return {key: entry.get('expires_at') for key, entry in store.data.copy().items()}
+    
+    if engine == "XML":
+        return _xml_scan(file)
+    if engine == "YML":
+        return _yml_scan(file)
+    
+    load_funcs = {"INI": _ini_load, "JSON": _json_load, "TOML": _toml_load}
+    data = load_funcs[engine](file)
+    return {key: entry.get('expires_at') for key, entry in data.items()}
 
 
 def has(key: str, *, file: str | None = None) -> bool:
@@ -585,7 +1305,7 @@ def has(key: str, *, file: str | None = None) -> bool:
     Check if a key exists in the storage backend
     :param key: Key to check
     :param file: Path to the storage file (engine auto-selected by extension)
-    :return: True if the key exists, False otherwise
+    :return: True if the key exists and has not expired, False otherwise
     :raise FileNotFoundError: If the specified file does not exist
     """
     # Determine engine from file extension
@@ -599,13 +1319,11 @@ def has(key: str, *, file: str | None = None) -> bool:
         raise FileNotFoundError(f'The specified .{extension} file does not exist: {parsed_file}')
     
     if engine == "SQLITE":
-        data = _sqlite_load(parsed_file)
-        return key in data
+        return _sqlite_has(key, parsed_file)
     
-    load_funcs = {"XML": _xml_load, "INI": _ini_load, "JSON": _json_load, "YML": _yml_load, "TOML": _toml_load}
-    data = load_funcs[engine](parsed_file)
+    expiries = _scan_keys(parsed_file, engine)
     
-    return key in data
+    return key in expiries and (expiries[key] is None or expiries[key] > time.time())
 
 
 def remove(key: str, *, file: str | None = None) -> bool:
@@ -629,17 +1347,15 @@ def remove(key: str, *, file: str | None = None) -> bool:
     if engine == "SQLITE":
         return _sqlite_remove(key, parsed_file)
     
-    load_funcs = {"XML": _xml_load, "INI": _ini_load, "JSON": _json_load, "YML": _yml_load, "TOML": _toml_load}
-    dump_funcs = {"XML": _xml_dump, "INI": _ini_dump, "JSON": _json_dump, "YML": _yml_dump, "TOML": _toml_dump}
-    
-    data = load_funcs[engine](parsed_file)
+    store = _get_store(parsed_file, engine)
+    store.refresh()
     
-    if key not in data:
+    entry, batch = store.pop(key)
+    if entry is None:
         return False
     
-    data.pop(key)
-    dump_funcs[engine](data, parsed_file)
-    return True
+    store.commit(batch)
+    return not _is_expired(entry, time.time())
 
 
 def match(regex: str = "", *, file: str | None = None) -> dict[str, Any]:
@@ -647,7 +1363,7 @@ def match(regex: str = "", *, file: str | None = None) -> dict[str, Any]:
     Return key-value pairs that match the regular expression
     :param regex: Regular expression string
     :param file: Path to the storage file (engine auto-selected by extension)
-    :return: Dictionary of matched results
+    :return: Dictionary of matched results (expired keys are skipped)
     :raise FileNotFoundError: If the specified file does not exist
     """
     # Determine engine from file extension
@@ -663,17 +1379,255 @@ def match(regex: str = "", *, file: str | None = None) -> dict[str, Any]:
     if engine == "SQLITE":
         data = _sqlite_load(parsed_file)
     else:
-        load_funcs = {"XML": _xml_load, "INI": _ini_load, "JSON": _json_load, "YML": _yml_load, "TOML": _toml_load}
-        data = load_funcs[engine](parsed_file)
+        store = _get_store(parsed_file, engine)
+        store.refresh()
+        data = store.data.copy()
+        _purge_expired(data, time.time())
     
     pattern = re.compile(regex)
     result = {}
-    for k in data:
+    for k, val in data.items():
         if pattern.match(k):
-            result[k] = read(k, file=file)
+            try:
+                result[k] = _json_compatible_to_python(_entry_to_json_value(val, engine))
+            except Exception as e:
+                raise ValueError(f'Unable to convert value to type {val["type"]}: {e}')
     return result
 
 
+def keys(*, file: str | None = None) -> list[str]:
+    r"""
+    List the keys in the storage backend without decoding any value
+    :param file: Path to the storage file (engine auto-selected by extension)
+    :return: List of unexpired keys
+    :raise FileNotFoundError: If the specified file does not exist
+    """
+    # Determine engine from file extension
+    extension = _get_extension_for_file(file)
+    engine = _get_engine_from_extension(extension)
+    
+    # Parse path with determined engine
+    parsed_file = _path_parser(file, engine)
+    
+    if not os.path.isfile(parsed_file):
+        raise FileNotFoundError(f'The specified .{extension} file does not exist: {parsed_file}')
+    
+    if engine == "SQLITE":
+        return _sqlite_keys(parsed_file)
+    
+    now = time.time()
+    return [key for key, expires_at in _scan_keys(parsed_file, engine).items()
+            if expires_at is None or expires_at > now]
+
+
+def count(*, file: str | None = None) -> int:
+    r"""
+    Count the keys in the storage backend without decoding any value
+    :param file: Path to the storage file (engine auto-selected by extension)
+    :return: Number of unexpired keys
+    :raise FileNotFoundError: If the specified file does not exist
+    """
+    # Determine engine from file extension
+    extension = _get_extension_for_file(file)
+    engine = _get_engine_from_extension(extension)
+    
+    # Parse path with determined engine
+    parsed_file = _path_parser(file, engine)
+    
+    if not os.path.isfile(parsed_file):
+        raise FileNotFoundError(f'The specified .{extension} file does not exist: {parsed_file}')
+    
+    if engine == "SQLITE":
+        conn, cursor = _sqlite_connect(parsed_file)
+        cursor.execute('SELECT COUNT(*) FROM simpsave WHERE expires_at IS NULL OR expires_at > ?', (time.time(),))
+        total = cursor.fetchone()[0]
+        conn.close()
+        return total
+    
+    return len(keys(file=file))
+
+
+_compact_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _sqlite_value_sizes(file: str) -> dict[str, int]:
+    r"""
+    Measure the values in SQLite database as compact JSON text, or their compressed payload
+    :param file: Path to the SQLite database file
+    :return: Mapping of unexpired key to size in bytes
+    """
+    conn, cursor = _sqlite_connect(file)
+    try:
+        try:
+            # The -> operator (SQLite 3.38+) yields the minified JSON text of the value
+            cursor.execute(
+                "SELECT key, CASE WHEN codec IS NULL "
+                "THEN length(CAST((CAST(value AS TEXT) -> '$.value') AS BLOB)) ELSE length(value) END "
+                "FROM simpsave WHERE expires_at IS NULL OR expires_at > ?",
+                (time.time(),)
+            )
+            return dict(cursor.fetchall())
+        except Exception:
+            cursor.execute(
+                'SELECT key, value, codec FROM simpsave WHERE expires_at IS NULL OR expires_at > ?', (time.time(),)
+            )
+            return {
+                key: len(value_blob) if codec is not None
+                else len(_compact_encoder.encode(_sqlite_decode(value_blob, None)['value']).encode('utf-8'))
+                for key, value_blob, codec in cursor.fetchall()
+            }
+    finally:
+        conn.close()
+
+
+def stats(*, file: str | None = None) -> dict[str, Any]:
+    r"""
+    Report statistics of the storage backend
+    :param file: Path to the storage file (engine auto-selected by extension)
+    :return: Dictionary with 'engine', 'file_size' (bytes), 'count' and 'sizes' (bytes per key of the value
+             as compact JSON text, or of its compressed payload when compressed)
+    :raise FileNotFoundError: If the specified file does not exist
+    """
+    # Determine engine from file extension
+    extension = _get_extension_for_file(file)
+    engine = _get_engine_from_extension(extension)
+    
+    # Parse path with determined engine
+    parsed_file = _path_parser(file, engine)
+    
+    if not os.path.isfile(parsed_file):
+        raise FileNotFoundError(f'The specified .{extension} file does not exist: {parsed_file}')
+    
+    sizes = {}
+    if engine == "SQLITE":
+        sizes = _sqlite_value_sizes(parsed_file)
+    elif os.path.getsize(parsed_file) > 0:
+        load_funcs = {"XML": _xml_load, "INI": _ini_load, "JSON": _json_load, "YML": _yml_load, "TOML": _toml_load}
+        data = load_funcs[engine](parsed_file)
+        _purge_expired(data, time.time())
+        for key, entry in data.items():
+            if entry.get('codec') is not None:
+                sizes[key] = len(base64.b64decode(entry['value']))
+            elif engine == "XML" or engine == "INI":
+                sizes[key] = len(entry['value'].encode('utf-8'))
+            else:
+                sizes[key] = len(_compact_encoder.encode(entry['value']).encode('utf-8'))
+    
+    return {
+        'engine': engine,
+        'file_size': os.path.getsize(parsed_file),
+        'count': len(sizes),
+        'sizes': sizes,
+    }
+
+
+def purge(*, file: str | None = None, batch_size: int = 1000) -> int:
+    r"""
+    Delete all expired keys from the storage backend
+    :param file: Path to the storage file (engine auto-selected by extension)
+    :param batch_size: Maximum number of keys deleted per transaction (SQLITE engine only)
+    :return: Number of keys deleted
+    :raise FileNotFoundError: If the specified file does not exist
+    :raise ValueError: If batch_size is not a positive integer
+    """
+    if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer")
+    
+    # Determine engine from file extension
+    extension = _get_extension_for_file(file)
+    engine = _get_engine_from_extension(extension)
+    
+    # Parse path with determined engine
+    parsed_file = _path_parser(file, engine)
+    
+    if not os.path.isfile(parsed_file):
+        raise FileNotFoundError(f'The specified .{extension} file does not exist: {parsed_file}')
+    
+    if engine == "SQLITE":
+        return _sqlite_purge(parsed_file, batch_size)
+    
+    store = _get_store(parsed_file, engine)
+    store.refresh()
+    
+    removed, batch = store.pop_expired(time.time())
+    # Only rewrite the file when something actually expired
+    if batch is not None:
+        store.commit(batch)
+    return removed
+
+
+_reapers: dict[str, tuple[threading.Thread, threading.Event]] = {}
+_reapers_lock = threading.Lock()
+
+
+def _reaper_loop(file: str | None, interval: float, batch_size: int, stop_event: threading.Event) -> None:
+    r"""
+    Background loop that periodically purges expired keys
+    :param file: Path to the storage file
+    :param interval: Seconds between sweeps
+    :param batch_size: Maximum number of keys deleted per transaction
+    :param stop_event: Event that stops the loop when set
+    """
+    while not stop_event.wait(interval):
+        try:
+            purge(file=file, batch_size=batch_size)
+        except Exception:
+            # The file may not exist yet or be mid-rewrite; retry on the next sweep
+            continue
+
+
+def start_reaper(*, file: str | None = None, interval: float = 60.0, batch_size: int = 1000) -> bool:
+    r"""
+    Start a background thread that periodically deletes expired keys
+    :param file: Path to the storage file (engine auto-selected by extension)
+    :param interval: Seconds between sweeps
+    :param batch_size: Maximum number of keys deleted per transaction (SQLITE engine only)
+    :return: True if a reaper was started, False if one is already running for the file
+    :raise ValueError: If interval or batch_size is not positive
+    """
+    if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval <= 0:
+        raise ValueError("interval must be a positive number")
+    if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer")
+    
+    extension = _get_extension_for_file(file)
+    parsed_file = _path_parser(file, _get_engine_from_extension(extension))
+    
+    with _reapers_lock:
+        if parsed_file in _reapers and _reapers[parsed_file][0].is_alive():
+            return False
+        stop_event = threading.Event()
+        thread = threading.Thread(
+            target=_reaper_loop,
+            args=(file, interval, batch_size, stop_event),
+            name=f'simpsave-reaper:{parsed_file}',
+            daemon=True,
+        )
+        _reapers[parsed_file] = (thread, stop_event)
+        thread.start()
+    return True
+
+
+def stop_reaper(*, file: str | None = None) -> bool:
+    r"""
+    Stop the background reaper thread of a storage file
+    :param file: Path to the storage file (engine auto-selected by extension)
+    :return: True if a running reaper was stopped, False otherwise
+    """
+    extension = _get_extension_for_file(file)
+    parsed_file = _path_parser(file, _get_engine_from_extension(extension))
+    
+    with _reapers_lock:
+        reaper = _reapers.pop(parsed_file, None)
+    if reaper is None:
+        return False
+    
+    thread, stop_event = reaper
+    stop_event.set()
+    thread.join()
+    return True
+
+
 def delete(*, file: str | None = None) -> bool:
     r"""
     Delete the storage file
@@ -695,6 +1649,349 @@ def delete(*, file: str | None = None) -> bool:
     
     try:
         os.remove(parsed_file)
-        return True
     except (IOError, OSError):
-        return False
\ No newline at end of file
+        return False
+    with _stores_lock:
+        _stores.pop(parsed_file, None)
+    return True
+
+
+def _open_entries(file: str, engine: str,
+                  now: float | None) -> tuple[int, Iterator[tuple[str, dict[str, Any]]]]:
+    r"""
+    Open a storage file for streaming its unexpired entries
+    :param file: Parsed path of the storage file
+    :param engine: Engine name
+    :param now: Timestamp entries must not have expired at, or None to include expired entries
+    :return: Number of entries and an iterator of (key, entry) pairs
+    :raise FileNotFoundError: If the file does not exist
+    """
+    if engine == "SQLITE":
+        if not os.path.isfile(file):
+            raise FileNotFoundError(f'The specified .db file does not exist: {file}')
+        conn, cursor = _sqlite_connect(file)
+        cursor.execute(
+            'SELECT COUNT(*) FROM simpsave WHERE ? IS NULL OR expires_at IS NULL OR expires_at > ?', (now, now)
+        )
+        total = cursor.fetchone()[0]
+        conn.close()
+        return total, _sqlite_iter(file, now)
+    
+    load_funcs = {"XML": _xml_load, "INI": _ini_load, "JSON": _json_load, "YML": _yml_load, "TOML": _toml_load}
+    if not os.path.isfile(file):
+        raise FileNotFoundError(f'The specified file does not exist: {file}')
+    # File-based formats have to be parsed as a whole
+    data = load_funcs[engine](file) if os.path.getsize(file) > 0 else {}
+    if now is not None:
+        _purge_expired(data, now)
+    return len(data), iter(data.items())
+
+
+_digest_encoder = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+
+def _entry_digest(key: str, value_type: str, json_value: Any) -> int:
+    r"""
+    Hash a single entry for order-independent checksums
+    :param key: Key of the entry
+    :param value_type: Type name of the value
+    :param json_value: JSON-compatible value
+    :return: Entry hash as an integer
+    """
+    payload = _digest_encoder.encode([key, value_type, json_value])
+    return int.from_bytes(hashlib.sha256(payload.encode('utf-8')).digest(), 'big')
+
+
+def _sqlite_copy(src: str, dst: str, batch_size: int, verify: bool,
+                 progress: Callable[[int, int], None] | None) -> int:
+    r"""
+    Copy unexpired rows between two SQLite databases without decoding them
+    :param src: Path to the source SQLite database file
+    :param dst: Path to the destination SQLite database file
+    :param batch_size: Number of rows copied per transaction and per progress report
+    :param verify: Whether to compare every copied row byte for byte afterwards
+    :param progress: Callback invoked as progress(copied, total) after each batch
+    :return: Number of rows copied
+    :raise RuntimeError: If verification fails
+    """
+    if not os.path.isfile(src):
+        raise FileNotFoundError(f'The specified .db file does not exist: {src}')
+    
+    # Bring the source schema up to date before reading its metadata columns
+    conn, _ = _sqlite_connect(src)
+    conn.close()
+    
+    now = time.time()
+    conn, cursor = _sqlite_connect(dst)
+    try:
+        cursor.execute('ATTACH DATABASE ? AS source', (src,))
+        cursor.execute(
+            'SELECT COUNT(*) FROM source.simpsave WHERE expires_at IS NULL OR expires_at > ?', (now,)
+        )
+        total = cursor.fetchone()[0]
+        
+        copied = 0
+        last_rowid = -1
+        while True:
+            # Walk the source by rowid so every batch is a bounded range scan
+            cursor.execute(
+                'SELECT MAX(rowid), COUNT(*) FROM (SELECT rowid FROM source.simpsave '
+                'WHERE rowid > ? AND (expires_at IS NULL OR expires_at > ?) ORDER BY rowid LIMIT ?)',
+                (last_rowid, now, batch_size)
+            )
+            upper_rowid, rows = cursor.fetchone()
+            if not rows:
+                break
+            cursor.execute(
+                'INSERT OR REPLACE INTO main.simpsave (key, value, expires_at, codec) '
+                'SELECT key, value, expires_at, codec FROM source.simpsave '
+                'WHERE rowid > ? AND rowid <= ? AND (expires_at IS NULL OR expires_at > ?)',
+                (last_rowid, upper_rowid, now)
+            )
+            conn.commit()
+            copied += rows
+            last_rowid = upper_rowid
+            if progress is not None:
+                progress(copied, total)
+        
+        if verify:
+            cursor.execute(
+                'SELECT COUNT(*) FROM source.simpsave AS s LEFT JOIN main.simpsave AS d '
+                'ON d.key = s.key AND d.value IS s.value AND d.expires_at IS s.expires_at AND d.codec IS s.codec '
+                'WHERE (s.expires_at IS NULL OR s.expires_at > ?) AND d.key IS NULL',
+                (now,)
+            )
+            if cursor.fetchone()[0]:
+                raise RuntimeError(f"Verification failed while converting {src} to {dst}")
+        
+        cursor.execute('DETACH DATABASE source')
+    finally:
+        conn.close()
+    return copied
+
+
+def convert(src: str, dst: str, *, batch_size: int = 1000, verify: bool = True,
+            progress: Callable[[int, int], None] | None = None) -> int:
+    r"""
+    Copy all unexpired entries from one storage file into another, converting between engines
+    :param src: Path to the source storage file (engine auto-selected by extension)
+    :param dst: Path to the destination storage file (engine auto-selected by extension); existing keys are replaced
+    :param batch_size: Number of entries written per transaction (SQLITE destination) and per progress report
+    :param verify: Whether to re-read the destination and compare checksums (SQLITE to SQLITE: rows) after copying
+    :param progress: Callback invoked as progress(copied, total) after each batch
+    :return: Number of entries copied
+    :raise FileNotFoundError: If the source file does not exist
+    :raise ValueError: If src and dst are the same file or batch_size is not a positive integer
+    :raise RuntimeError: If checksum verification fails
+    """
+    if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer")
+    
+    src_engine = _get_engine_from_extension(_get_extension_for_file(src))
+    dst_engine = _get_engine_from_extension(_get_extension_for_file(dst))
+    parsed_src = _path_parser(src, src_engine)
+    parsed_dst = _path_parser(dst, dst_engine)
+    
+    if parsed_src == parsed_dst:
+        raise ValueError(f"Source and destination are the same file: {parsed_src}")
+    
+    # Rows can be copied verbatim unless the destination recompresses them
+    if src_engine == dst_engine == "SQLITE" and parsed_dst not in _compression:
+        return _sqlite_copy(parsed_src, parsed_dst, batch_size, verify, progress)
+    
+    # One reference time for the whole conversion, so keys expiring mid-copy do not fail verification
+    now = time.time()
+    total, entries = _open_entries(parsed_src, src_engine, now)
+    
+    conn = cursor = None
+    data = {}
+    if dst_engine == "SQLITE":
+        conn, cursor = _sqlite_connect(parsed_dst)
+    
+    copied = 0
+    checksum = 0
+    keys = set()
+    rows = []
+    try:
+        for key, entry in entries:
+            json_value = _entry_to_json_value(entry, src_engine)
+            value_type = entry['type']
+            expires_at = entry.get('expires_at')
+            
+            if dst_engine == "SQLITE":
+                value_blob, codec = _sqlite_encode(json_value, value_type, parsed_dst)
+                rows.append((key, value_blob, expires_at, codec))
+            else:
+                data[key] = _make_entry(json_value, value_type, dst_engine, parsed_dst)
+                if expires_at is not None:
+                    data[key]['expires_at'] = expires_at
+            
+            if verify:
+                checksum = (checksum + _entry_digest(key, value_type, json_value)) % (1 << 256)
+                keys.add(key)
+            copied += 1
+            
+            if copied % batch_size == 0:
+                if rows:
+                    cursor.executemany(
+                        'INSERT OR REPLACE INTO simpsave (key, value, expires_at, codec) VALUES (?, ?, ?, ?)', rows
+                    )
+                    conn.commit()
+                    rows.clear()
+                if progress is not None:
+                    progress(copied, total)
+        
+        if rows:
+            cursor.executemany(
+                'INSERT OR REPLACE INTO simpsave (key, value, expires_at, codec) VALUES (?, ?, ?, ?)', rows
+            )
+            conn.commit()
+    finally:
+        if conn is not None:
+            conn.close()
+    
+    if dst_engine != "SQLITE":
+        dump_funcs = {"XML": _xml_dump, "INI": _ini_dump, "JSON": _json_dump, "YML": _yml_dump, "TOML": _toml_dump}
+        store = _get_store(parsed_dst, dst_engine)
+        # Serialize with in-process writers; their pending mutations are rebased onto this dump
+        with store.flush_lock:
+            merged = _load_file(parsed_dst, dst_engine)
+            _purge_expired(merged, now)
+            merged.update(data)
+            dump_funcs[dst_engine](merged, parsed_dst)
+    
+    if progress is not None and copied % batch_size != 0:
+        progress(copied, total)
+    
+    if verify:
+        _, written = _open_entries(parsed_dst, dst_engine, None)
+        found = 0
+        written_checksum = 0
+        for key, entry in written:
+            if key not in keys:
+                continue
+            found += 1
+            json_value = _entry_to_json_value(entry, dst_engine)
+            written_checksum = (written_checksum + _entry_digest(key, entry['type'], json_value)) % (1 << 256)
+        if found != copied or written_checksum != checksum:
+            raise RuntimeError(f"Checksum verification failed while converting {parsed_src} to {parsed_dst}")
+    
+    return copied
+
+
+class _Missing:
+    r"""
+    Type of the MISSING sentinel
+    """
+    
+    def __repr__(self) -> str:
+        return 'simpsave.MISSING'
+
+
+MISSING = _Missing()
+
+
+def _watch_snapshot(file: str, engine: str, pattern: re.Pattern | None) -> dict[str, tuple[Any, str, float | None]]:
+    r"""
+    Take a snapshot of the watched keys of a storage file
+    :param file: Parsed path of the storage file
+    :param engine: Engine name
+    :param pattern: Compiled key filter, or None to watch all keys
+    :return: Mapping of key to (JSON-compatible value, type name, expiry timestamp)
+    :raise FileNotFoundError: If the file does not exist
+    """
+    _, entries = _open_entries(file, engine, time.time())
+    return {
+        key: (_entry_to_json_value(entry, engine), entry['type'], entry.get('expires_at'))
+        for key, entry in entries
+        if pattern is None or pattern.match(key)
+    }
+
+
+def _watch_diff(old: dict[str, tuple[Any, str, float | None]],
+                new: dict[str, tuple[Any, str, float | None]]) -> Iterator[tuple[str, Any, Any]]:
+    r"""
+    Compute change events between two snapshots
+    :param old: Previous snapshot
+    :param new: Current snapshot
+    :return: Iterator of (key, old value, new value); a missing side is MISSING
+    """
+    for key in sorted(old.keys() | new.keys()):
+        before, after = old.get(key), new.get(key)
+        if before is not None and after is not None and before[:2] == after[:2]:
+            continue
+        old_value = _json_compatible_to_python(before[0]) if before is not None else MISSING
+        new_value = _json_compatible_to_python(after[0]) if after is not None else MISSING
+        # Sets may serialize in a different order without changing
+        if before is not None and after is not None and before[1] == after[1] and old_value == new_value:
+            continue
+        yield key, old_value, new_value
+
+
+def watch(*, file: str | None = None, keys: str | None = None, interval: float = 1.0,
+          stop: threading.Event | None = None) -> Iterator[tuple[str, Any, Any]]:
+    r"""
+    Watch a storage file and yield an event for every key that changes
+    :param file: Path to the storage file (engine auto-selected by extension)
+    :param keys: Regular expression restricting the watched keys, or None to watch all keys
+    :param interval: Seconds between checks for changes
+    :param stop: Event that ends the watch when set
+    :return: Iterator of (key, old value, new value); old is MISSING for added keys and new is MISSING for removed or expired keys
+    :raise ValueError: If interval is not positive
+    """
+    if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval <= 0:
+        raise ValueError("interval must be a positive number")
+    
+    # Determine engine from file extension
+    extension = _get_extension_for_file(file)
+    engine = _get_engine_from_extension(extension)
+    
+    # Parse path with determined engine
+    parsed_file = _path_parser(file, engine)
+    
+    pattern = re.compile(keys) if keys is not None else None
+    conn = None
+    conn_inode = None
+    
+    def signature() -> tuple | None:
+        nonlocal conn, conn_inode
+        file_signature = _file_signature(parsed_file)
+        if file_signature is None or engine != "SQLITE":
+            return file_signature
+        # Commits may only touch the WAL, so ask SQLite whether anyone else committed
+        inode = file_signature[0]
+        if conn is None or conn_inode != inode:
+            if conn is not None:
+                conn.close()
+            conn, _ = _sqlite_connect(parsed_file)
+            conn_inode = inode
+        return inode, conn.execute('PRAGMA data_version').fetchone()[0]
+    
+    try:
+        current = signature()
+        snapshot = _watch_snapshot(parsed_file, engine, pattern) if current is not None else {}
+        
+        while True:
+            if stop is not None:
+                if stop.wait(interval):
+                    return
+            else:
+                time.sleep(interval)
+            
+            latest = signature()
+            next_expiry = min((entry[2] for entry in snapshot.values() if entry[2] is not None), default=None)
+            if latest == current and (next_expiry is None or next_expiry > time.time()):
+                continue
+            
+            try:
+                latest_snapshot = _watch_snapshot(parsed_file, engine, pattern) if latest is not None else {}
+            except Exception:
+                # The file is being rewritten; try again on the next check
+                continue
+            
+            current = latest
+            yield from _watch_diff(snapshot, latest_snapshot)
+            snapshot = latest_snapshot
+    finally:
+        if conn is not None:
+            conn.close()
@@ -0,0 +1,26 @@
+"""
+@file conftest.py
+@author WaterRun
+@version 10.1
+@date 2025-11-10
+@description Shared pytest configuration: benchmarks are skipped unless --benchmark is given
+"""
+
+import pytest
+
+
+def pytest_addoption(parser) -> None:
+    parser.addoption('--benchmark', action='store_true', default=False, help='run tests marked as benchmark')
+
+
+def pytest_configure(config) -> None:
+    config.addinivalue_line('markers', 'benchmark: throughput measurement, skipped unless --benchmark is given')
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    if config.getoption('--benchmark'):
+        return
+    skip = pytest.mark.skip(reason='benchmark, run with --benchmark')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,161 @@
+"""
+@file test_concurrency.py
+@author WaterRun
+@version 10.1
+@date 2025-11-10
+@description Stress tests for the shared in-process store of file-based engines
+
+Run from the source directory with: python -m pytest -q tests
+Add --benchmark to also run the read throughput benchmark.
+
+Read scaling: readers take no locks, but on a standard CPython build the GIL
+still runs the Python-level decoding of one read at a time, so aggregate read
+throughput stays roughly flat as threads are added instead of growing linearly.
+The benchmark therefore only requires that adding readers does not collapse
+throughput (no lock contention). On a free-threaded build it requires a real
+speed-up.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+import simpsave as ss
+from simpsave import core
+
+THREADS = 8
+WRITES_PER_THREAD = 25
+
+
+def _engine_params() -> list:
+    r"""
+    File-based engines, skipping those whose optional dependency is missing
+    :return: pytest parameters of file extensions
+    """
+    missing = {
+        'yml': importlib.util.find_spec('yaml') is None,
+        'toml': importlib.util.find_spec('tomli_w') is None,
+    }
+    return [
+        pytest.param(ext, marks=pytest.mark.skip(reason=f'{ext} dependency not installed'))
+        if missing.get(ext) else ext
+        for ext in ('xml', 'ini', 'json', 'yml', 'toml')
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stores():
+    core._stores.clear()
+    yield
+    core._stores.clear()
+
+
+def _run_threads(target, count: int, *args) -> None:
+    r"""
+    Run a function on several threads and re-raise the first failure
+    :param target: Function called as target(index, *args)
+    :param count: Number of threads
+    """
+    errors = []
+
+    def runner(index: int) -> None:
+        try:
+            target(index, *args)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=runner, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=120)
+        assert not thread.is_alive(), 'thread did not finish'
+    if errors:
+        raise errors[0]
+
+
+@pytest.mark.parametrize('ext', _engine_params())
+def test_concurrent_writes_lose_no_updates(tmp_path, ext):
+    file = str(tmp_path / f'store.{ext}')
+
+    def writer(index: int) -> None:
+        for i in range(WRITES_PER_THREAD):
+            assert ss.write(f't{index}_{i}', [index, i], file=file)
+            assert ss.write('shared', index, file=file)
+
+    _run_threads(writer, THREADS)
+
+    # Drop the in-process image so everything below comes from disk
+    core._stores.clear()
+    engine = core._get_engine_from_extension(ext)
+    on_disk = core._load_file(os.path.abspath(file), engine)
+    expected = {f't{t}_{i}' for t in range(THREADS) for i in range(WRITES_PER_THREAD)}
+    assert set(on_disk) == expected | {'shared'}
+
+    core._stores.clear()
+    for t in range(THREADS):
+        for i in range(WRITES_PER_THREAD):
+            assert ss.read(f't{t}_{i}', file=file) == [t, i]
+    assert ss.read('shared', file=file) in range(THREADS)
+
+
+@pytest.mark.parametrize('ext', _engine_params())
+def test_concurrent_removes_and_writes(tmp_path, ext):
+    file = str(tmp_path / f'store.{ext}')
+    for i in range(THREADS * WRITES_PER_THREAD):
+        assert ss.write(f'old{i}', i, file=file)
+
+    def worker(index: int) -> None:
+        for i in range(WRITES_PER_THREAD):
+            assert ss.remove(f'old{index * WRITES_PER_THREAD + i}', file=file)
+            assert ss.write(f'new{index}_{i}', i, file=file)
+
+    _run_threads(worker, THREADS)
+
+    core._stores.clear()
+    expected = {f'new{t}_{i}' for t in range(THREADS) for i in range(WRITES_PER_THREAD)}
+    assert set(ss.keys(file=file)) == expected
+
+
+def test_failed_flush_does_not_block_writers(tmp_path):
+    bad = str(tmp_path / 'bad.json')
+    with open(bad, 'w', encoding='utf-8') as f:
+        json.dump({'x': {'value': 1, 'type': 'int', 'expires_at': 'soon'}}, f)
+
+    assert ss.write('a', 1, file=bad) is False
+    # The single writer thread survives and still serves other stores
+    good = str(tmp_path / 'good.json')
+    assert ss.write('a', 1, file=good)
+    assert ss.read('a', file=good) == 1
+
+
+@pytest.mark.benchmark
+def test_read_throughput_across_threads(tmp_path):
+    file = str(tmp_path / 'store.json')
+    for i in range(100):
+        assert ss.write(f'k{i}', {'i': i, 'items': list(range(10))}, file=file)
+
+    total_reads = 8000
+
+    def reader(index: int, reads: int) -> None:
+        for i in range(reads):
+            key = f'k{(index + i) % 100}'
+            assert ss.read(key, file=file)['i'] == (index + i) % 100
+
+    throughput = {}
+    for count in (1, 2, 4, 8):
+        start = time.perf_counter()
+        _run_threads(reader, count, total_reads // count)
+        throughput[count] = total_reads / (time.perf_counter() - start)
+    report = f'reads/s by thread count: { {k: round(v) for k, v in throughput.items()} }'
+
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    if gil_enabled:
+        assert throughput[8] >= 0.5 * throughput[1], report
+    else:
+        assert throughput[4] >= 1.5 * throughput[1], report